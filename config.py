@@ -1,9 +1,14 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+@lru_cache(maxsize=16)
+def _generic_participant_names(count):
+    return tuple(f"Person {i+1}" for i in range(count))
+
 class Config:
     """Configuration settings for Google Meet Recording Bot"""
     
@@ -20,25 +25,31 @@ class Config:
     BASE_OUTPUT_DIR = "outputs"
     AUDIO_OUTPUT_DIR = os.path.join(BASE_OUTPUT_DIR, "audio")
     EXPORT_OUTPUT_DIR = os.path.join(BASE_OUTPUT_DIR, "exports")
+    CACHE_OUTPUT_DIR = os.path.join(BASE_OUTPUT_DIR, "cache")  # Transcripts keyed by audio hash
     
     # Generic participant names (empty = use "Person 1", "Person 2")
     DEFAULT_SPEAKER_NAMES = []  # Empty for generic names
     
     # Audio Device Settings
     MIC_DEVICE_ID = 1           # Your working microphone
-    SYSTEM_AUDIO_DEVICE_ID = 7  # Your working system audio
+    SYSTEM_AUDIO_DEVICE_ID = None  # Stereo Mix/loopback device index; None records the default input
     
     @classmethod
     def create_directories(cls):
-        os.makedirs(cls.AUDIO_OUTPUT_DIR, exist_ok=True)
-        os.makedirs(cls.EXPORT_OUTPUT_DIR, exist_ok=True)
+        # Create the shared parent once, then one mkdir per leaf instead of a makedirs walk each
+        os.makedirs(cls.BASE_OUTPUT_DIR, exist_ok=True)
+        for directory in (cls.AUDIO_OUTPUT_DIR, cls.EXPORT_OUTPUT_DIR, cls.CACHE_OUTPUT_DIR):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
     
     @classmethod
     def get_participant_names(cls, count=2):
-        """Return generic 'Person N' format when no names provided"""
+        """Return generic 'Person N' format when no names provided (as a tuple)"""
         if not cls.DEFAULT_SPEAKER_NAMES:
-            return [f"Person {i+1}" for i in range(count)]
-        return cls.DEFAULT_SPEAKER_NAMES[:count]
+            return _generic_participant_names(count)
+        return tuple(cls.DEFAULT_SPEAKER_NAMES[:count])
     
     @classmethod
     def validate_api_key(cls):
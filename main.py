@@ -1,40 +1,28 @@
 import os
-import time
+import logging
+import re
 import signal
+import sys
+import threading
 from datetime import datetime
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Loads environment variables from .env file
+from config import Config
 
-from src.meet_bot import GoogleMeetBot
-from src.audio_recorder import AudioRecorder
-from src.transcription_service import TranscriptionService
+# Meet meeting links look like https://meet.google.com/abc-defg-hij (scheme optional)
+_MEET_RE = re.compile(r'^(?:https?://)?meet\.google\.com/[a-z]{3}-[a-z]{4}-[a-z]{3}(?:[/?#]|$)')
 
-# Configuration
-class Config:
-    BASE_OUTPUT_DIR = "outputs"
-    AUDIO_OUTPUT_DIR = os.path.join(BASE_OUTPUT_DIR, "audio")
-    EXPORT_OUTPUT_DIR = os.path.join(BASE_OUTPUT_DIR, "exports")
-    
-    @classmethod
-    def create_directories(cls):
-        os.makedirs(cls.AUDIO_OUTPUT_DIR, exist_ok=True)
-        os.makedirs(cls.EXPORT_OUTPUT_DIR, exist_ok=True)
+# Seconds between meeting-alive checks while recording
+MEETING_CHECK_INTERVAL = 10.0
 
-# Global variables
-recording_active = True
-shutdown_requested = False
+# Set by Ctrl+C to wake the recording wait immediately
+stop_event = threading.Event()
 
 def signal_handler(signum, frame):
-    global recording_active, shutdown_requested
-    recording_active = False
-    shutdown_requested = True
+    stop_event.set()
     print("\n🛑 Stopping bot...")
 
 def main():
-    global recording_active, shutdown_requested
-    
     signal.signal(signal.SIGINT, signal_handler)
     
     print("🤖 GOOGLE MEET RECORDING BOT - ENHANCED")
@@ -46,14 +34,17 @@ def main():
     print("🚫 Completely silent operation")
     print("=" * 100)
     
-    Config.create_directories()
-    
     meet_url = input("\n🌐 Enter Google Meet URL: ").strip()
     
-    if "meet.google.com" not in meet_url:
+    if not _MEET_RE.match(meet_url.lower()):
         print("❌ Invalid Google Meet URL")
         return
     
+    # Heavy imports (selenium, pyaudio, numpy, assemblyai) only once the URL is valid
+    from src.meet_bot import GoogleMeetBot
+    from src.audio_recorder import AudioRecorder
+    from src.transcription_service import TranscriptionService
+    
     # Initialize components
     bot = GoogleMeetBot()
     transcription_service = TranscriptionService()
@@ -81,14 +72,11 @@ def main():
         print(f"\n3. 📝 Recording active...")
         print("   Press Ctrl+C to stop recording and transcribe")
         
-        try:
-            while recording_active and not shutdown_requested:
-                time.sleep(1)
-                if not bot.is_meeting_active():
-                    print("\n⚠️ Meeting ended")
-                    break
-        except KeyboardInterrupt:
-            print("\n🛑 Stopped by user")
+        # Ctrl+C is handled by signal_handler, which sets stop_event
+        while not stop_event.wait(MEETING_CHECK_INTERVAL):
+            if not bot.is_meeting_active():
+                print("\n⚠️ Meeting ended")
+                break
         
         # Step 4: Stop recording
         print(f"\n4. ⏹️ Processing recording...")
@@ -98,17 +86,23 @@ def main():
             print("❌ No audio recorded")
             return
         
-        # Step 5: Transcribe
+        # Step 5: Transcribe straight into the transcript file
         print(f"\n5. 🤖 Starting transcription...")
-        participant_names = ["Person 1", "Person 2", "Person 3", "Person 4"]
-        transcript_text = transcription_service.transcribe_audio(audio_file, participant_names)
+        transcript_filename = f"{Config.EXPORT_OUTPUT_DIR}/transcript_{timestamp}.txt"
+        
+        # Write to a sibling temp file and swap it in, so a crash never leaves a truncated transcript
+        tmp_filename = transcript_filename + '.tmp'
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                transcription_service.transcribe_audio(audio_file, f)
+        except BaseException:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
         
         # Step 6: Save transcript
         print(f"\n6. 💾 Saving transcript...")
-        transcript_filename = f"{Config.EXPORT_OUTPUT_DIR}/transcript_{timestamp}.txt"
-        
-        with open(transcript_filename, 'w', encoding='utf-8') as f:
-            f.write(transcript_text)
+        os.replace(tmp_filename, transcript_filename)
         
         # Success summary
         print(f"\n🎉 SUCCESS!")
@@ -130,4 +124,9 @@ def main():
     input("\nPress Enter to exit...")
 
 if __name__ == "__main__":
+    # Libraries (httpx, faster_whisper, webdriver-manager) stay at WARNING; only the bot's own
+    # messages are shown at INFO. Set src.meet_bot to logging.DEBUG to see per-step bot status
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stdout)
+    logging.getLogger("src.meet_bot").setLevel(logging.INFO)
+    Config.create_directories()
     main()
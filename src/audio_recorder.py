@@ -1,78 +1,157 @@
 import os
+import atexit
+import queue
 import threading
 import wave
-import pyaudio
-import numpy as np
-import time
+from collections import deque
+from config import Config
+
+FRAMES_PER_BUFFER = 2048
+PREVIEW_BUFFERS = 22  # ~1 second of recent buffers kept in memory
+PROGRESS_TICK = 44100 * 3 // FRAMES_PER_BUFFER  # Buffers between progress updates (~3 seconds)
+METER_STRIDE = 8  # Frame stride for the live volume meter
+WAV_HEADER_BYTES = 44
+
+# PortAudio scans every host API and device on init, so share one instance per process
+_PA = None
+
+def _get_pa():
+    """Return the process-wide PyAudio instance, creating it on first use"""
+    global _PA
+    if _PA is None:
+        import pyaudio
+        _PA = pyaudio.PyAudio()
+        atexit.register(_PA.terminate)
+    return _PA
 
 class AudioRecorder:
     """Audio Recorder that captures Chrome's meeting audio via system recording"""
 
     def __init__(self):
         self.recording = False
-        self.frames = []
+        self._wf = None
+        self._preview = deque(maxlen=PREVIEW_BUFFERS)
+        self._bytes_recorded = 0
+        self._progress = queue.Queue(maxsize=4)
+        self._stop_event = threading.Event()
         self.thread = None
+        self.progress_thread = None
         self.session_name = None
         self.save_dir = None
+        self.file_path = None
 
     def find_audio_devices(self):
-        """Try different Stereo Mix devices for better quality"""
-        print("🎵 Testing different audio devices...")
+        """Return the configured system audio device if it supports our capture format, or None for the default"""
+        import pyaudio
         
-        # Try these device indices in order
-        test_devices = [8, 18, 24, 1]  # From your device list
+        p = _get_pa()
+        device_id = Config.SYSTEM_AUDIO_DEVICE_ID
         
-        for device_id in test_devices:
-            print(f"   Testing device {device_id}")
-            return None, device_id
-
+        # Device indices differ per machine, so only probe one the user configured explicitly
+        if device_id is not None:
+            print(f"🎵 Testing configured audio device {device_id}...")
+            try:
+                if p.is_format_supported(44100, input_device=device_id, input_channels=2,
+                                         input_format=pyaudio.paInt16):
+                    name = p.get_device_info_by_index(device_id)['name']
+                    print(f"   ✅ Using device {device_id}: {name}")
+                    return device_id
+            except (ValueError, OSError):
+                pass
+            print(f"   ⚠️ Device {device_id} doesn't support 44.1kHz stereo")
+        
+        # Never fall through to another device: the default input is where Stereo Mix is expected
+        try:
+            name = p.get_default_input_device_info()['name']
+        except (IOError, OSError):
+            name = "unknown"
+        print(f"   🎙️ Using default input: {name}")
+        return None
 
     def start_recording(self, session_name, save_dir):
+        # Load the audio stack up front so a broken install fails here, not in the recorder thread
+        try:
+            import numpy  # Used by the recorder thread
+            _get_pa()
+        except (ImportError, OSError) as e:
+            print(f"❌ Audio setup failed: {e}")
+            print("💡 Install PyAudio and numpy (pip install -r requirements.txt)")
+            return False
+        
         os.makedirs(save_dir, exist_ok=True)
         self.session_name = session_name
         self.save_dir = save_dir
+        self.file_path = os.path.join(save_dir, f"{session_name}.wav")
+        
+        # Stream straight to disk so memory use doesn't grow with meeting length
+        self._wf = wave.open(self.file_path, 'wb')
+        self._wf.setnchannels(2)      # Stereo
+        self._wf.setsampwidth(2)      # 16-bit
+        self._wf.setframerate(44100)  # 44.1kHz
+        
         self.recording = True
-        self.frames = []
+        self._stop_event.clear()
+        self._preview.clear()
+        self._bytes_recorded = 0
+        self.progress_thread = threading.Thread(target=self._print_progress, daemon=True)
+        self.progress_thread.start()
         self.thread = threading.Thread(target=self._record)
         self.thread.start()
         print("🎧 Started recording Chrome's meeting audio")
         return True
 
     def _record(self):
-        p = pyaudio.PyAudio()
+        # Imported lazily so importing this module stays cheap
+        import pyaudio
+        import numpy as np
+        
         stream = None
+        ticks_left = PROGRESS_TICK
+        
+        def on_audio(in_data, frames, time_info, status):
+            """Runs on PortAudio's audio thread for every captured buffer"""
+            nonlocal ticks_left
+            
+            # Header sizes are patched once when the file is closed
+            self._wf.writeframesraw(in_data)
+            self._preview.append(in_data)
+            self._bytes_recorded += len(in_data)
+            
+            # Show progress every 3 seconds
+            ticks_left -= 1
+            if ticks_left == 0:
+                ticks_left = PROGRESS_TICK
+                # Every 8th stereo frame (both channels) is plenty for a volume readout
+                audio_array = np.frombuffer(in_data, dtype=np.int16).reshape(-1, 2)[::METER_STRIDE]
+                peak = max(-int(audio_array.min()), int(audio_array.max()))
+                
+                # Printing happens on the progress thread; drop the update if it falls behind
+                try:
+                    self._progress.put_nowait((self._bytes_recorded, peak))
+                except queue.Full:
+                    pass
+            
+            return (None, pyaudio.paContinue if self.recording else pyaudio.paComplete)
         
         try:
-            # Open default recording device (should be Stereo Mix)
+            p = _get_pa()
+            
+            # Open the probed device (None falls back to the default, which should be Stereo Mix)
             stream = p.open(
                 format=pyaudio.paInt16,
                 channels=2,              # Stereo for better quality
                 rate=44100,
                 input=True,
-                frames_per_buffer=1024
+                input_device_index=self.find_audio_devices(),
+                frames_per_buffer=FRAMES_PER_BUFFER,
+                stream_callback=on_audio
             )
+            stream.start_stream()
             
             print("🔴 Recording Chrome meeting audio via Stereo Mix...")
             
-            frame_count = 0
-            while self.recording:
-                data = stream.read(1024, exception_on_overflow=False)
-                self.frames.append(data)
-                frame_count += 1
-                
-                # Show progress every 3 seconds
-                if frame_count % (44100 // 1024 * 3) == 0:
-                    duration = frame_count * 1024 / 44100
-                    mins, secs = divmod(int(duration), 60)
-                    
-                    # Check volume level
-                    audio_array = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-                    volume = np.max(np.abs(audio_array))
-                    
-                    status = "🎵 RECORDING" if volume > 0.01 else "🔇 SILENT"
-                    print(f"\r   {status} {mins:02d}:{secs:02d} (vol: {volume:.3f})", end="", flush=True)
-                
-                time.sleep(0.001)
+            # Capture runs in PortAudio's thread; just wait to be stopped
+            self._stop_event.wait()
                 
         except Exception as e:
             print(f"❌ Recording error: {e}")
@@ -85,51 +164,74 @@ class AudioRecorder:
             if stream:
                 stream.stop_stream()
                 stream.close()
-            p.terminate()
-            print(f"\n⏹️ Recording stopped - {len(self.frames)} frames captured")
+            print(f"\n⏹️ Recording stopped - {self._bytes_recorded // 4096} frames captured")
+
+    def _print_progress(self):
+        """Print recording progress sent by the capture thread until stopped"""
+        while True:
+            update = self._progress.get()
+            if update is None:
+                break
+            
+            bytes_recorded, peak = update
+            duration = bytes_recorded / 4 / 44100
+            mins, secs = divmod(int(duration), 60)
+            volume = peak / 32768.0
+            
+            status = "🎵 RECORDING" if volume > 0.01 else "🔇 SILENT"
+            print(f"\r   {status} {mins:02d}:{secs:02d} (vol: {volume:.3f})", end="", flush=True)
 
     def stop_recording(self):
         self.recording = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join()
+        if self.progress_thread:
+            self._progress.put(None)
+            self.progress_thread.join()
+        
+        file_path = self.file_path
+        if self._wf:
+            self._wf.close()
+            self._wf = None
         
-        if not self.frames:
+        if not self._bytes_recorded:
             print("❌ No audio frames recorded")
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
             return None
         
-        file_path = os.path.join(self.save_dir, f"{self.session_name}.wav")
-        
-        with wave.open(file_path, 'wb') as wf:
-            wf.setnchannels(2)      # Stereo
-            wf.setsampwidth(2)      # 16-bit  
-            wf.setframerate(44100)  # 44.1kHz
-            wf.writeframes(b''.join(self.frames))
-        
-        # Verify the saved file
-        file_size = os.path.getsize(file_path)
-        duration = len(self.frames) * 1024 / 44100
+        # Sizes are known from the capture counters; no need to stat or re-read the file
+        file_size = self._bytes_recorded + WAV_HEADER_BYTES
+        duration = self._bytes_recorded / 4 / 44100
         
         print(f"✅ Meeting audio saved: {file_path}")
         print(f"   📊 Size: {file_size:,} bytes ({duration:.1f}s)")
         
-        # Quick volume analysis
+        # Quick volume analysis on the last second still held in memory
         try:
-            with wave.open(file_path, 'rb') as test_wf:
-                sample_data = test_wf.readframes(min(test_wf.getnframes(), 44100))
-                sample_audio = np.frombuffer(sample_data, dtype=np.int16).astype(np.float32) / 32768.0
-                if len(sample_audio) > 2:
-                    # Average stereo channels for analysis
-                    sample_audio = np.mean(sample_audio.reshape(-1, 2), axis=1)
-                sample_volume = np.max(np.abs(sample_audio))
-                print(f"   📈 Audio level: {sample_volume:.4f}")
+            import numpy as np
+            
+            # Reduce each buffer in place rather than joining them into one copy
+            peak = 0
+            for buf in self._preview:
+                if not buf:
+                    continue
+                # Average stereo channels for analysis (sum in int32, halve at the end)
+                channel_sum = np.frombuffer(buf, dtype=np.int16).reshape(-1, 2).sum(axis=1, dtype=np.int32)
+                peak = max(peak, -int(channel_sum.min()), int(channel_sum.max()))
+            sample_volume = peak / 2 / 32768.0
+            print(f"   📈 Audio level: {sample_volume:.4f}")
+            
+            if sample_volume > 0.01:
+                print(f"   ✅ Chrome meeting audio captured successfully!")
+                print(f"   🎯 Ready for transcription with both your voice and participants!")
+            else:
+                print(f"   ⚠️ Low audio - Chrome may not be outputting meeting audio")
+                print(f"       Check Chrome audio settings and Stereo Mix configuration")
                 
-                if sample_volume > 0.01:
-                    print(f"   ✅ Chrome meeting audio captured successfully!")
-                    print(f"   🎯 Ready for transcription with both your voice and participants!")
-                else:
-                    print(f"   ⚠️ Low audio - Chrome may not be outputting meeting audio")
-                    print(f"       Check Chrome audio settings and Stereo Mix configuration")
-                    
         except Exception as e:
             print(f"   ⚠️ Could not analyze audio: {e}")
         
@@ -1,158 +1,410 @@
 import os
-import time
+import atexit
+import copy
+import logging
+import re
+import shutil
+import socket
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, InvalidSessionIdException, WebDriverException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.remote_connection import ChromeRemoteConnection
 
-class GoogleMeetBot:
-    def __init__(self):
-        self.browser = None
-        self.is_active = False
-        self.participant_names = []
+logger = logging.getLogger(__name__)
 
-    def setup_browser(self):
-        options = Options()
+# Persistent Chrome profile so the HTTP cache and first-run setup survive between runs
+CHROME_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".meet_bot_profile")
+# Chrome holds this file in the profile while running (a symlink on Linux/macOS)
+CHROME_LOCK_FILE = os.path.join(CHROME_PROFILE_DIR, "lockfile" if os.name == "nt" else "SingletonLock")
+
+# Analytics and ad beacons only; Meet's own assets and push channels are left alone
+BLOCKED_URL_PATTERNS = [
+    "*play.google.com/log*",
+    "*googleads.g.doubleclick.net*",
+]
+
+# Leave-call and people buttons; present only once the bot is inside the meeting
+MEET_TOOLBAR_SELECTOR = 'button[aria-label*="Leave call" i]'
+PEOPLE_BUTTON_SELECTOR = 'button[aria-label^="Show people"]'
+
+# Everything the bot runs in the page: webdriver flag, mic override, camera hiding and audio muting.
+# Registered via CDP so it runs before Meet's own scripts on every document; also safe to
+# execute again later (one-time hooks are guarded, the DOM pass just re-applies).
+_MEET_BOT_SETUP_JS = """
+(function () {
+    // Hide ONLY camera indicators, KEEP microphone indicator visible
+    function hideCameraKeepMic() {
+        const cameraSelectors = [
+            'div[aria-label*="camera" i]:not([aria-label*="microphone" i])',
+            '.camera-indicator:not(.mic-indicator)',
+            '[data-testid*="camera"]:not([data-testid*="mic"])',
+            'button[aria-label*="camera" i]:not([aria-label*="microphone" i])'
+        ];
         
-        # ALLOW Chrome to ACCESS audio but keep bot INVISIBLE with mic indicator
-        options.add_argument("--use-fake-ui-for-media-stream")      # Auto-approve media
-        options.add_argument("--allow-running-insecure-content")    # Allow insecure content
-        options.add_argument("--disable-web-security")              # Disable web security
-        options.add_argument("--disable-features=VizDisplayCompositor")
-        options.add_argument("--autoplay-policy=no-user-gesture-required")
+        cameraSelectors.forEach(selector => {
+            const elements = document.querySelectorAll(selector);
+            elements.forEach(el => {
+                if (el.textContent.toLowerCase().includes('camera') ||
+                    el.getAttribute('aria-label')?.toLowerCase().includes('camera')) {
+                    el.style.display = 'none';
+                    el.style.visibility = 'hidden';
+                    if (el.tagName === 'BUTTON') {
+                        el.disabled = true;
+                    }
+                }
+            });
+        });
         
-        # DON'T mute audio - Chrome needs to hear meeting for recording
-        # options.add_argument("--mute-audio")  # REMOVED
+        // EXPLICITLY keep microphone indicators visible for green circle
+        const micSelectors = [
+            'div[aria-label*="microphone" i]',
+            '.mic-indicator',
+            '[data-testid*="mic"]',
+            'button[aria-label*="microphone" i]',
+            '.recording-indicator'
+        ];
         
-        # Stability & Performance
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
+        micSelectors.forEach(selector => {
+            const elements = document.querySelectorAll(selector);
+            elements.forEach(el => {
+                el.style.display = 'block';
+                el.style.visibility = 'visible';
+            });
+        });
+    }
+    
+    // Mute only bot's own media elements, don't interfere with mic indicator
+    function silenceBotMedia() {
+        const botMediaElements = document.querySelectorAll('video[autoplay], audio[autoplay]');
+        botMediaElements.forEach(el => {
+            el.muted = true;
+            el.volume = 0;
+            el.pause();
+        });
+    }
+    
+    if (!window.__meetBotInstalled) {
+        window.__meetBotInstalled = true;
         
-        # Anti-detection
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument("--disable-blink-features=AutomationControlled")
+        // Anti-detection
+        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
         
-        # ALLOW Chrome audio access, BLOCK bot mic, show mic indicator
-        prefs = {
-            "profile.default_content_setting_values": {
-                "media_stream": 1,              # ALLOW media streams for system recording
-                "media_stream_mic": 1,          # ALLOW mic indicator (green circle) 
-                "media_stream_camera": 2,       # BLOCK camera (bot invisible)
-                "notifications": 2,             # BLOCK notifications
-                "geolocation": 2,               # BLOCK location
-            },
-            "profile.managed_default_content_settings": {
-                "media_stream": 1               # ALLOW managed media for recording
+        // BLOCK bot's actual microphone audio but KEEP visual indicator
+        const originalGetUserMedia = navigator.mediaDevices && navigator.mediaDevices.getUserMedia;
+        if (originalGetUserMedia) {
+            navigator.mediaDevices.getUserMedia = function(constraints) {
+                if (constraints && constraints.audio) {
+                    // Create a silent audio stream to show mic indicator without actual audio
+                    return navigator.mediaDevices.getUserMedia({audio: false}).then(() => {
+                        // Return a fake silent audio stream that shows indicator
+                        const audioContext = new AudioContext();
+                        const stream = audioContext.createMediaStreamDestination().stream;
+                        return stream;
+                    }).catch(() => {
+                        // Fallback: block actual mic but allow indicator
+                        return Promise.reject(new Error('Microphone blocked for invisible bot'));
+                    });
+                }
+                return originalGetUserMedia.apply(this, arguments);
+            };
+        }
+    }
+    
+    // Re-hide camera controls when Meet re-renders. Meet mutates the page constantly during a call,
+    // so passes are throttled: at most one per 750 ms, trailing so the last change is always handled
+    function watchDom() {
+        const minInterval = 750;
+        let pending = false;
+        let lastRun = 0;
+        new MutationObserver(() => {
+            if (pending) {
+                return;
             }
+            pending = true;
+            setTimeout(() => {
+                pending = false;
+                lastRun = Date.now();
+                hideCameraKeepMic();
+            }, Math.max(0, lastRun + minInterval - Date.now()));
+        }).observe(document.body, {
+            subtree: true,
+            childList: true,
+            attributes: true,
+            attributeFilter: ['aria-label', 'class']
+        });
+    }
+    
+    function applyToDom() {
+        hideCameraKeepMic();
+        silenceBotMedia();
+        if (!window.__meetBotObserving) {
+            window.__meetBotObserving = true;
+            watchDom();
         }
-        options.add_experimental_option("prefs", prefs)
-        
-        # Unique temporary profile to avoid conflicts
-        temp_profile_dir = os.path.join(os.getcwd(), f"temp_chrome_profile_{uuid.uuid4().hex[:8]}")
-        options.add_argument(f"--user-data-dir={temp_profile_dir}")
-        options.add_argument("--profile-directory=Default")
+    }
+    
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', applyToDom, {once: true});
+    } else {
+        applyToDom();
+    }
+    
+    console.log('🚫 Bot silent, camera hidden, MIC INDICATOR VISIBLE');
+})();
+"""
 
-        try:
-            print("Trying system ChromeDriver...")
-            self.browser = webdriver.Chrome(options=options)
-            print("✅ Using system ChromeDriver")
-        except Exception as e:
-            print(f"System ChromeDriver failed: {e}")
+# Any of the buttons that open the participants panel
+_SHOW_PEOPLE_SELECTOR = ", ".join([
+    PEOPLE_BUTTON_SELECTOR,
+    'button[aria-label*="participant" i]',
+    'button[aria-label*="people" i]',
+    '[data-testid="participants-button"]',
+    'button[aria-label="Show everyone"]'
+])
+
+# Label plus badge text of the people button, where Meet shows the participant count
+_PEOPLE_BUTTON_TEXT_JS = """
+const button = document.querySelector(arguments[0]);
+return button ? (button.getAttribute('aria-label') || '') + ' ' + button.textContent : null;
+"""
+
+# Name element inside each participant list item, most specific first
+_PARTICIPANT_NAME_SELECTORS = [
+    '.zWfAib',
+    '.ZjFb7c',
+    'span[jsname]',
+    '[data-participant-name]',
+    'div[data-self-name]',
+    '.participant-name'
+]
+# Names to skip (the bot itself, "(You)", placeholders); the pattern is also compiled in the page
+_EXCLUDED_NAME_RE = re.compile(r"\b(bot|recorder|recording|system|unknown|guest|you|yourself)\b", re.I)
+
+# Counts participants and collects their filtered, de-duplicated names; returns {count, names}
+_EXTRACT_PARTICIPANTS_JS = """
+const nameSelectors = arguments[0];
+const excluded = new RegExp(arguments[1], 'i');
+const items = Array.from(document.querySelectorAll('div[role="listitem"]'));
+const seen = new Set();
+const names = [];
+let count = 0;
+
+items.forEach(item => {
+    if (item.innerText.trim()) {
+        count++;
+    }
+    // First selector that matches wins (a comma list would pick whichever comes first in the DOM)
+    let el = null;
+    for (const selector of nameSelectors) {
+        el = item.querySelector(selector);
+        if (el) {
+            break;
+        }
+    }
+    if (!el) {
+        return;
+    }
+    const name = el.innerText.trim();
+    if (name.length > 1 && name.length < 50 && !seen.has(name) && !excluded.test(name)) {
+        seen.add(name);
+        names.push(name);
+    }
+});
+
+return {count: count, names: names};
+"""
+
+def _start_service(executable_path):
+    """Start a chromedriver process for the given binary"""
+    service = Service(executable_path)
+    service.start()
+    return service
+
+def _start_system_service():
+    # webdriver-manager caches the binary (~/.wdm), so it is only downloaded once
+    from webdriver_manager.chrome import ChromeDriverManager
+    return _start_service(ChromeDriverManager().install())
+
+def _driver_launchers():
+    """Name -> start function for every chromedriver source available on this machine"""
+    launchers = {"system ChromeDriver": _start_system_service}
+    if os.path.exists("chromedriver.exe"):
+        launchers["local chromedriver.exe"] = lambda: _start_service("chromedriver.exe")
+    return launchers
+
+def _stop_started_service(future):
+    """Done-callback that stops a chromedriver the caller never used"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().stop()
+
+def _started_services(launchers):
+    """Start every chromedriver source together and yield (name, service) as each one comes up"""
+    print(f"Trying {' and '.join(launchers)}...")
+    pool = ThreadPoolExecutor(max_workers=len(launchers))
+    futures = {pool.submit(launch): name for name, launch in launchers.items()}
+    pool.shutdown(wait=False)
+    handed_out = set()
+    try:
+        for future in as_completed(futures):
             try:
-                if os.path.exists("chromedriver.exe"):
-                    print("Trying local chromedriver.exe...")
-                    service = Service("chromedriver.exe")
-                    self.browser = webdriver.Chrome(service=service, options=options)
-                    print("✅ Using local chromedriver.exe")
-                else:
-                    return False
+                service = future.result()
             except Exception as e:
-                print(f"Local ChromeDriver failed: {e}")
-                return False
+                print(f"{futures[future]} failed: {e}")
+                continue
+            handed_out.add(future)
+            yield futures[future], service
+    finally:
+        # Slower drivers stay up as a fallback until the caller is done, then stop once started
+        for future in futures:
+            if future not in handed_out:
+                future.add_done_callback(_stop_started_service)
 
-        # Anti-detection script
-        self.browser.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+def _profile_in_use():
+    """True if a running Chrome holds the persistent profile; a lock left by a crash doesn't count"""
+    if not os.path.lexists(CHROME_LOCK_FILE):
+        return False
+    
+    if os.name == "nt":
+        # A running Chrome keeps the lockfile open, so it can only be deleted once Chrome is gone
+        try:
+            os.remove(CHROME_LOCK_FILE)
+            return False
+        except OSError:
+            return True
+    
+    # SingletonLock is a symlink to "<hostname>-<pid>"; Chrome clears a stale one itself on launch
+    try:
+        host, _, pid = os.readlink(CHROME_LOCK_FILE).rpartition("-")
+        if host != socket.gethostname():
+            return True
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (OSError, ValueError):
         return True
+    return True
 
-    def inject_invisibility_script(self):
-        """Make bot invisible but KEEP microphone indicator (green circle) visible"""
-        invisibility_script = """
-        // BLOCK bot's actual microphone audio but KEEP visual indicator
-        const originalGetUserMedia = navigator.mediaDevices.getUserMedia;
-        navigator.mediaDevices.getUserMedia = function(constraints) {
-            if (constraints && constraints.audio) {
-                // Create a silent audio stream to show mic indicator without actual audio
-                return navigator.mediaDevices.getUserMedia({audio: false}).then(() => {
-                    // Return a fake silent audio stream that shows indicator
-                    const audioContext = new AudioContext();
-                    const stream = audioContext.createMediaStreamDestination().stream;
-                    return stream;
-                }).catch(() => {
-                    // Fallback: block actual mic but allow indicator
-                    return Promise.reject(new Error('Microphone blocked for invisible bot'));
-                });
-            }
-            return originalGetUserMedia.apply(this, arguments);
-        };
-        
-        // Hide ONLY camera indicators, KEEP microphone indicator visible
-        function hideCameraKeepMic() {
-            const cameraSelectors = [
-                'div[aria-label*="camera" i]:not([aria-label*="microphone" i])',
-                '.camera-indicator:not(.mic-indicator)', 
-                '[data-testid*="camera"]:not([data-testid*="mic"])',
-                'button[aria-label*="camera" i]:not([aria-label*="microphone" i])'
-            ];
-            
-            cameraSelectors.forEach(selector => {
-                const elements = document.querySelectorAll(selector);
-                elements.forEach(el => {
-                    if (el.textContent.toLowerCase().includes('camera') ||
-                        el.getAttribute('aria-label')?.toLowerCase().includes('camera')) {
-                        el.style.display = 'none';
-                        el.style.visibility = 'hidden';
-                    }
-                });
-            });
-            
-            // EXPLICITLY keep microphone indicators visible for green circle
-            const micSelectors = [
-                'div[aria-label*="microphone" i]',
-                '.mic-indicator',
-                '[data-testid*="mic"]',
-                'button[aria-label*="microphone" i]',
-                '.recording-indicator'
-            ];
-            
-            micSelectors.forEach(selector => {
-                const elements = document.querySelectorAll(selector);
-                elements.forEach(el => {
-                    el.style.display = 'block';
-                    el.style.visibility = 'visible';
-                });
-            });
+@lru_cache(maxsize=1)
+def _build_base_options():
+    """Chrome options shared by every bot; callers copy before adding per-instance arguments"""
+    options = Options()
+    
+    # ALLOW Chrome to ACCESS audio but keep bot INVISIBLE with mic indicator
+    options.add_argument("--use-fake-ui-for-media-stream")      # Auto-approve media
+    options.add_argument("--allow-running-insecure-content")    # Allow insecure content
+    options.add_argument("--disable-web-security")              # Disable web security
+    options.add_argument("--autoplay-policy=no-user-gesture-required")
+    
+    # DON'T mute audio - Chrome needs to hear meeting for recording
+    # options.add_argument("--mute-audio")  # REMOVED
+    
+    # Stability & Performance (no --disable-gpu: it forces slow software compositing on
+    # current Chrome; use --headless=new if headless is ever needed)
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    
+    # Anti-detection
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    
+    # ALLOW Chrome audio access, BLOCK bot mic, show mic indicator
+    prefs = {
+        "profile.default_content_setting_values": {
+            "media_stream": 1,              # ALLOW media streams for system recording
+            "media_stream_mic": 1,          # ALLOW mic indicator (green circle) 
+            "media_stream_camera": 2,       # BLOCK camera (bot invisible)
+            "notifications": 2,             # BLOCK notifications
+            "geolocation": 2,               # BLOCK location
+        },
+        "profile.managed_default_content_settings": {
+            "media_stream": 1               # ALLOW managed media for recording
         }
+    }
+    options.add_experimental_option("prefs", prefs)
+    return options
+
+class GoogleMeetBot:
+    # chromedriver process shared by every bot in this process; stopped at interpreter exit
+    _service = None
+    _service_name = None
+
+    def __init__(self):
+        self.browser = None
+        self.is_active = False
+        self.participant_names = []
+        self.temp_profile_dir = None
+
+    def setup_browser(self):
+        # Shared flags and prefs are built once; only the profile dir differs per instance
+        options = copy.deepcopy(_build_base_options())
         
-        hideCameraKeepMic();
-        setInterval(hideCameraKeepMic, 1000);
-        
-        console.log('🚫 Bot silent, camera hidden, MIC INDICATOR VISIBLE');
-        """
+        # Reuse the persistent profile; fall back to a unique temp one if another bot is using it
+        if _profile_in_use():
+            self.temp_profile_dir = os.path.join(os.getcwd(), f"temp_chrome_profile_{uuid.uuid4().hex[:8]}")
+            profile_dir = self.temp_profile_dir
+            print("⚠️ Chrome profile in use by another bot, using a temporary profile")
+        else:
+            os.makedirs(CHROME_PROFILE_DIR, exist_ok=True)
+            profile_dir = CHROME_PROFILE_DIR
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument("--profile-directory=Default")
+
+        # A driver that starts but doesn't match Chrome only fails here, so keep the others warm until one works
+        shared = GoogleMeetBot._service
+        if shared is not None and shared.is_connectable():
+            candidates = [(GoogleMeetBot._service_name, shared)]
+        else:
+            candidates = _started_services(_driver_launchers())
+        try:
+            for name, service in candidates:
+                try:
+                    executor = ChromeRemoteConnection(remote_server_addr=service.service_url, keep_alive=True)
+                    self.browser = webdriver.Remote(command_executor=executor, options=options)
+                except Exception as e:
+                    print(f"Chrome launch failed with {name}: {e}")
+                    service.stop()
+                    if service is GoogleMeetBot._service:
+                        GoogleMeetBot._service = None
+                    continue
+                
+                if service is not GoogleMeetBot._service:
+                    print(f"✅ Using {name}")
+                    GoogleMeetBot._service = service
+                    GoogleMeetBot._service_name = name
+                    atexit.register(service.stop)
+                break
+            else:
+                return False
+        finally:
+            if hasattr(candidates, "close"):
+                candidates.close()
+
+        # Install the stealth script before any page script runs, so Meet never sees the real getUserMedia
+        self._execute_cdp("Page.addScriptToEvaluateOnNewDocument", {"source": _MEET_BOT_SETUP_JS})
         
+        # Skip telemetry and decorative assets the bot never needs
         try:
-            self.browser.execute_script(invisibility_script)
-            print("🚫 Invisibility script injected (mic indicator kept visible)")
+            self._execute_cdp("Network.enable", {})
+            self._execute_cdp("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
         except Exception as e:
-            print(f"⚠️ Script injection warning: {e}")
+            logger.warning("⚠️ Could not block non-essential requests: %s", e)
+        return True
+
+    def _execute_cdp(self, cmd, params):
+        """Run a Chrome DevTools Protocol command (Remote sessions have no execute_cdp_cmd)"""
+        return self.browser.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
 
     def navigate_to_meet(self, url):
         try:
@@ -162,52 +414,42 @@ class GoogleMeetBot:
                 
             print(f"📱 Opening: {url}")
             self.browser.get(url)
-            time.sleep(5)
             
-            self.inject_invisibility_script()
-            time.sleep(3)
+            # A slow load is still usable, so a timeout here is not a failure
+            try:
+                self._wait_for_page_load()
+            except TimeoutException:
+                logger.warning("⚠️ Page still loading after 15s, continuing")
+            
+            # Stealth script is already installed via CDP; click_join waits for the join button itself
             return True
         except Exception as e:
             print(f"❌ Failed to open URL: {e}")
             return False
 
-    def force_complete_silence(self):
-        """Keep bot silent but maintain microphone indicator visibility"""
-        print("🚫 FORCING BOT SILENCE (keeping mic indicator visible)...")
-        
-        self.inject_invisibility_script()
-        
-        # Disable only bot's audio output, keep visual indicators
-        silence_script = """
-        // Disable bot's actual audio but keep visual indicators
-        const botMediaElements = document.querySelectorAll('video[autoplay], audio[autoplay]');
-        botMediaElements.forEach(el => {
-            el.muted = true;
-            el.pause();
-        });
-        
-        // Hide only camera buttons, keep microphone visual indicators
-        const cameraButtons = document.querySelectorAll('button[aria-label*="camera" i]:not([aria-label*="microphone" i])');
-        cameraButtons.forEach(btn => {
-            btn.style.display = 'none';
-            btn.disabled = true;
-        });
-        
-        // EXPLICITLY keep microphone buttons/indicators visible for green circle
-        const micButtons = document.querySelectorAll('button[aria-label*="microphone" i]');
-        micButtons.forEach(btn => {
-            btn.style.display = 'block';
-            btn.style.visibility = 'visible';
-        });
-        
-        console.log('🚫 Bot silenced, mic indicator visible for green circle');
-        """
-        
+    def _apply_stealth(self):
+        """Keep bot silent and camera hidden but KEEP microphone indicator (green circle) visible"""
         try:
-            self.browser.execute_script(silence_script)
-            print("   ✅ Bot silenced, mic indicator kept visible")
+            self.browser.execute_script(_MEET_BOT_SETUP_JS)
+            logger.debug("🚫 Bot silenced, camera hidden (mic indicator kept visible)")
         except Exception as e:
-            print(f"   ⚠️ Silence enforcement warning: {e}")
+            logger.warning("⚠️ Stealth script warning: %s", e)
+
+    def _wait_for_page_load(self, timeout=15):
+        """Wait until the current document has finished loading"""
+        WebDriverWait(self.browser, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+
+    def _wait_for_element(self, selector, timeout=10):
+        """Wait for a CSS selector to appear; returns False on timeout"""
+        try:
+            WebDriverWait(self.browser, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            return True
+        except TimeoutException:
+            return False
 
     def extract_real_participants(self):
         """Extract participant names with smart detection"""
@@ -215,64 +457,37 @@ class GoogleMeetBot:
             print("👥 Extracting REAL participant names...")
             participants = []
             
-            # Try to open participant panel
-            panel_opened = False
-            show_selectors = [
-                'button[aria-label^="Show people"]',
-                'button[aria-label*="participant" i]', 
-                'button[aria-label*="people" i]',
-                '[data-testid="participants-button"]',
-                'button[aria-label="Show everyone"]'
-            ]
+            # Cheap check first: the people button usually carries the count (e.g. "Show everyone (3)")
+            button_text = self.browser.execute_script(_PEOPLE_BUTTON_TEXT_JS, _SHOW_PEOPLE_SELECTOR)
+            count_match = re.search(r'\d+', button_text or "")
+            if count_match and int(count_match.group()) < 2:
+                print("   ⚠️ No other participants yet, using default 2-person setup")
+                return ["Person 1", "Person 2"]
             
-            for selector in show_selectors:
-                try:
-                    btn = WebDriverWait(self.browser, 3).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    btn.click()
-                    time.sleep(3)
-                    panel_opened = True
-                    print("   ✅ Participants panel opened")
-                    break
-                except:
-                    continue
+            # Try to open participant panel (one combined selector = one wait, max 3s)
+            panel_opened = False
+            try:
+                btn = WebDriverWait(self.browser, 3).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, _SHOW_PEOPLE_SELECTOR))
+                )
+                btn.click()
+                self._wait_for_element('div[role="listitem"]', timeout=3)
+                panel_opened = True
+                print("   ✅ Participants panel opened")
+            except:
+                pass
             
             if panel_opened:
-                # Count total participants
-                participant_count_elements = self.browser.find_elements(By.CSS_SELECTOR, 'div[role="listitem"]')
-                actual_count = len([elem for elem in participant_count_elements if elem.text.strip()])
+                # Count and read names inside the page in one round-trip
+                result = self.browser.execute_script(
+                    _EXTRACT_PARTICIPANTS_JS, _PARTICIPANT_NAME_SELECTORS, _EXCLUDED_NAME_RE.pattern
+                )
+                actual_count = result["count"]
                 print(f"   📊 Detected {actual_count} participants in meeting")
                 
-                # Extract names from participant list
-                name_selectors = [
-                    'div[role="listitem"] .zWfAib',
-                    'div[role="listitem"] .ZjFb7c',
-                    'div[role="listitem"] span[jsname]',
-                    '[data-participant-name]',
-                    'div[role="listitem"] div[data-self-name]',
-                    'div[role="listitem"] .participant-name'
-                ]
-                
-                excluded_keywords = ['bot', 'recorder', 'recording', 'system', 'unknown', 'guest', 'you', '(you)', 'yourself']
-                
-                for selector in name_selectors:
-                    try:
-                        elements = self.browser.find_elements(By.CSS_SELECTOR, selector)
-                        for elem in elements:
-                            name = elem.text.strip()
-                            if (name and 
-                                len(name) > 1 and 
-                                len(name) < 50 and
-                                not any(keyword in name.lower() for keyword in excluded_keywords) and
-                                name not in participants):
-                                participants.append(name)
-                                print(f"   ✅ Found participant: {name}")
-                        
-                        if participants:
-                            break
-                    except:
-                        continue
+                for name in result["names"]:
+                    participants.append(name)
+                    print(f"   ✅ Found participant: {name}")
                 
                 # Close panel
                 try:
@@ -287,8 +502,8 @@ class GoogleMeetBot:
                 except:
                     pass
                 
-                # Smart fallback with correct participant count
-                unique_participants = list(dict.fromkeys(participants))
+                # Smart fallback with correct participant count (names are already unique)
+                unique_participants = participants
                 
                 if len(unique_participants) > 0:
                     if len(unique_participants) < actual_count:
@@ -321,33 +536,6 @@ class GoogleMeetBot:
             print(f"   ❌ Participant extraction error: {e}")
             return ["Person 1", "Person 2"]
 
-    def mute_bot_audio(self):
-        """Mute only bot's audio output, keep mic indicator visible"""
-        try:
-            mute_script = """
-            // Mute only bot's audio elements, don't interfere with mic indicator
-            const botAudioElements = document.querySelectorAll('audio[autoplay], video[autoplay]');
-            botAudioElements.forEach(element => {
-                element.muted = true;
-                element.volume = 0;
-            });
-            
-            // Keep microphone indicators visible
-            const micIndicators = document.querySelectorAll('div[aria-label*="microphone" i]');
-            micIndicators.forEach(indicator => {
-                indicator.style.display = 'block';
-                indicator.style.visibility = 'visible';
-            });
-            
-            console.log('🔇 Bot audio muted, mic indicator visible for green circle');
-            """
-            
-            self.browser.execute_script(mute_script)
-            print("🔇 Bot audio muted (mic indicator visible for green circle)")
-            
-        except Exception as e:
-            print(f"⚠️ Mute audio warning: {e}")
-
     def click_join(self):
         """Enhanced join button clicking"""
         print("🔍 Looking for join button...")
@@ -374,7 +562,7 @@ class GoogleMeetBot:
                 if element.is_displayed() and element.is_enabled():
                     element.click()
                     print(f"✅ Clicked: {description}")
-                    time.sleep(5)
+                    self._wait_after_join_click()
                     return True
                     
             except TimeoutException:
@@ -385,13 +573,26 @@ class GoogleMeetBot:
         # Fallback: Enter key
         try:
             print("🔄 Trying Enter key fallback...")
-            body = self.browser.find_element(By.TAG_NAME, 'body')
-            body.send_keys(Keys.ENTER)
-            time.sleep(5)
-            return True
+            ActionChains(self.browser).send_keys(Keys.ENTER).perform()
+            
+            # Only report success once the leave-call button shows we actually joined
+            if self._wait_for_element(MEET_TOOLBAR_SELECTOR):
+                return True
+            print("⚠️ Enter key did not join the meeting")
+            return False
         except:
             return False
 
+    def _wait_after_join_click(self, timeout=10):
+        """Return as soon as the page has settled on Meet after a join attempt"""
+        try:
+            WebDriverWait(self.browser, timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+                and "meet.google.com" in d.current_url
+            )
+        except TimeoutException:
+            pass
+
     def join_meeting(self, url):
         """Join meeting with Chrome audio access, bot silence, and visible mic indicator"""
         if not self.setup_browser():
@@ -400,9 +601,6 @@ class GoogleMeetBot:
         if not self.navigate_to_meet(url):
             return False
         
-        # Keep bot silent but show mic indicator and allow Chrome to hear meeting
-        self.force_complete_silence()
-        
         if not self.click_join():
             print("❌ All join methods failed")
             return False
@@ -410,13 +608,12 @@ class GoogleMeetBot:
         self.is_active = True
         print("✅ Meeting joined successfully (BOT SILENT, MIC INDICATOR VISIBLE)")
         
-        # Mute only bot, keep mic indicator, allow system recording
-        time.sleep(3)
-        self.mute_bot_audio()
-        self.force_complete_silence()
+        # Re-apply to the in-call DOM: mute only bot, keep mic indicator, allow system recording
+        self._wait_for_element(MEET_TOOLBAR_SELECTOR)
+        self._apply_stealth()
         
         # Extract participant names
-        time.sleep(5)
+        self._wait_for_element(PEOPLE_BUTTON_SELECTOR)
         self.participant_names = self.extract_real_participants()
         
         return True
@@ -431,16 +628,16 @@ class GoogleMeetBot:
         try:
             if self.browser:
                 self.browser.quit()
+                self.browser = None
                 print("🌐 Browser closed")
                 
-            # Cleanup temp profiles
-            import shutil
-            temp_dirs = [d for d in os.listdir('.') if d.startswith('temp_chrome_profile_')]
-            for temp_dir in temp_dirs:
+            # Only a fallback temp profile is removed; the persistent profile is kept for the next run
+            if self.temp_profile_dir:
                 try:
-                    shutil.rmtree(temp_dir)
-                    print(f"🗑️ Cleaned temp profile: {temp_dir}")
+                    shutil.rmtree(self.temp_profile_dir)
+                    print(f"🗑️ Cleaned temp profile: {os.path.basename(self.temp_profile_dir)}")
                 except:
                     pass
+                self.temp_profile_dir = None
         except Exception as e:
             print(f"⚠️ Cleanup warning: {e}")
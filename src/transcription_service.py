@@ -2,16 +2,34 @@
 Complete Transcription Service with Speaker Diarization for Conversation Format
 """
 
+import io
 import os
+import copy
 import time
+import json
+import hashlib
 import numpy as np
 from datetime import datetime
 import re
+import struct
+import threading
 import wave
+from collections import Counter
+from itertools import groupby, islice
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from dotenv import load_dotenv
+from config import Config
 
 load_dotenv()
 
+try:
+    from faster_whisper import WhisperModel, decode_audio
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
 try:
     import whisper
     WHISPER_AVAILABLE = True
@@ -24,50 +42,258 @@ try:
 except ImportError:
     ASSEMBLYAI_AVAILABLE = False
 
+# With faster-whisper, long recordings are split at pauses into ~30 s chunks and transcribed in parallel
+WHISPER_CHUNK_SECONDS = 30
+WHISPER_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+WHISPER_SAMPLE_RATE = 16000
+WHISPER_VAD_MIN_SILENCE_MS = 500  # Pauses at least this long are skipped by the VAD prefilter
+
+# Sentence breaks and speaker-change phrases for formatting plain text as a conversation
+_SENT_SPLIT = re.compile(r'[.!?]+\s*')
+_WORD_RE = re.compile(r"[a-z']+")
+_CUES = frozenset({
+    'yes', 'no', 'okay', 'right', 'sure', 'well', 'so', 'but', 'however',
+    'actually', 'basically', 'definitely'
+})
+_MULTI_CUES = ('i think', 'i believe')
+
+def _env_int(name, default):
+    """Read a positive integer setting from the environment, falling back to default if it isn't one"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        print(f"⚠️ Ignoring {name}={value!r}: not a whole number, using {default}")
+        return default
+    # A zero-permit semaphore would block every transcription forever
+    return max(1, number)
+
+def _split_at_silences(audio):
+    """Cut 16 kHz audio into chunks of up to WHISPER_CHUNK_SECONDS, ending each in a pause between speech"""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    
+    chunk_samples = WHISPER_CHUNK_SECONDS * WHISPER_SAMPLE_RATE
+    speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=WHISPER_VAD_MIN_SILENCE_MS))
+    
+    chunks = []
+    start = end = 0
+    for span in speech:
+        # Close the chunk in the gap before this span if taking it would overrun the target length;
+        # a single span longer than that stays whole rather than being cut mid-word
+        if span["end"] - start > chunk_samples and end > start:
+            cut = (end + span["start"]) // 2
+            chunks.append(audio[start:cut])
+            start = cut
+        end = span["end"]
+    chunks.append(audio[start:])
+    return chunks
+
+@lru_cache(maxsize=32)
+def _audio_digest(path, size, mtime):
+    """SHA-256 of the audio bytes; size and mtime in the key invalidate it when the file changes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _wav_layout(path):
+    """Locate the data chunk of a 16-bit PCM WAV; returns (offset, channels, rate, frames) or None"""
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            return None
+        
+        # Truncated or malformed chunks return None so get_audio_info falls back to wave
+        try:
+            fmt = None
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    return None
+                chunk_id, size = chunk[:4], struct.unpack('<I', chunk[4:])[0]
+                if chunk_id == b'fmt ':
+                    # format tag, channels, sample rate, byte rate, block align, bits per sample
+                    fmt = struct.unpack('<HHIIHH', f.read(16))
+                    f.seek(size - 16 + (size & 1), 1)
+                elif chunk_id == b'data':
+                    if not fmt or fmt[0] != 1 or fmt[5] != 16 or not fmt[1] or not fmt[2]:
+                        return None
+                    return f.tell(), fmt[1], fmt[2], size // (fmt[1] * 2)
+                else:
+                    f.seek(size + (size & 1), 1)
+        except (struct.error, ValueError, OSError):
+            return None
+
+class _WebhookListener:
+    """Local HTTP endpoint that AssemblyAI calls when a transcript is finished"""
+    
+    def __init__(self, port):
+        received = self.received = set()
+        cond = self.cond = threading.Condition()
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                try:
+                    transcript_id = json.loads(body).get('transcript_id')
+                except (ValueError, AttributeError):
+                    transcript_id = None
+                self.send_response(200 if transcript_id else 400)
+                self.end_headers()
+                if transcript_id:
+                    with cond:
+                        received.add(transcript_id)
+                        cond.notify_all()
+            
+            def log_message(self, *args):
+                pass
+        
+        # Loopback only; a tunnel or reverse proxy forwards ASSEMBLYAI_WEBHOOK_URL here
+        self.server = HTTPServer(("127.0.0.1", port), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def wait(self, transcript_id, timeout):
+        """Block until the webhook for this transcript fires; returns False on timeout"""
+        with self.cond:
+            done = self.cond.wait_for(lambda: transcript_id in self.received, timeout)
+            self.received.discard(transcript_id)
+            return done
+
+# One listener per port, shared by concurrent transcriptions and kept for the life of the process
+_WEBHOOK_LISTENERS = {}
+_WEBHOOK_LISTENERS_LOCK = threading.Lock()
+
+def _get_webhook_listener(port):
+    """Return the shared listener for this port; raises OSError if the port can't be bound"""
+    with _WEBHOOK_LISTENERS_LOCK:
+        listener = _WEBHOOK_LISTENERS.get(port)
+        if listener is None:
+            listener = _WEBHOOK_LISTENERS[port] = _WebhookListener(port)
+        return listener
+
 class TranscriptionService:
+    # Shared by every instance: local Whisper saturates CPU/VRAM, AssemblyAI calls are network-bound
+    _whisper_sem = threading.Semaphore(_env_int('WHISPER_MAX_CONCURRENCY', 1))
+    _aai_sem = threading.Semaphore(_env_int('ASSEMBLYAI_MAX_CONCURRENCY', 8))
+    _load_lock = threading.Lock()
+
     def __init__(self):
-        self.whisper_model = None
-        self.assemblyai_client = None
-        self.diarization_pipeline = None
-
-        # Initialize AssemblyAI with extended timeout
-        if ASSEMBLYAI_AVAILABLE:
-            api_key = os.getenv('ASSEMBLYAI_API_KEY')
-            if api_key and len(api_key) > 10:
-                try:
-                    aai.settings.api_key = api_key
-                    aai.settings.http_timeout = 300.0      # 5 minute timeout
-                    aai.settings.polling_interval = 10.0   # Check every 10 seconds
-                    self.assemblyai_client = aai.Transcriber()
-                    print("✅ AssemblyAI initialized - Premium transcription ready!")
-                except Exception as e:
-                    print(f"⚠️ AssemblyAI initialization failed: {e}")
-            else:
-                print("⚠️ AssemblyAI API key missing or invalid.")
+        # Optional: public URL that forwards to the local webhook port, to avoid polling
+        self.webhook_url = os.getenv('ASSEMBLYAI_WEBHOOK_URL')
+        self.webhook_port = _env_int('ASSEMBLYAI_WEBHOOK_PORT', 8765)
+
+        self.assemblyai_client = self._init_assemblyai()
+        self._aai_config = self._build_aai_config() if self.assemblyai_client else None
+        
+        # Whisper and pyannote are only needed on the fallback path; load them on first use
+        self._whisper = None
+        self._whisper_backend = None
+        self._whisper_loaded = False
+        self._diarization = None
+        self._diarization_loaded = False
+
+    @property
+    def whisper_model(self):
+        if not self._whisper_loaded:
+            with self._load_lock:
+                if not self._whisper_loaded:
+                    self._whisper, self._whisper_backend = self._init_whisper()
+                    self._whisper_loaded = True
+        return self._whisper
+
+    @property
+    def whisper_backend(self):
+        return self._whisper_backend if self.whisper_model else None
+
+    @property
+    def diarization_pipeline(self):
+        if not self._diarization_loaded:
+            with self._load_lock:
+                if not self._diarization_loaded:
+                    self._diarization = self._init_pyannote()
+                    self._diarization_loaded = True
+        return self._diarization
+
+    def _init_assemblyai(self):
+        """Initialize AssemblyAI with extended timeout; returns the transcriber or None"""
+        if not ASSEMBLYAI_AVAILABLE:
+            return None
+        
+        api_key = os.getenv('ASSEMBLYAI_API_KEY')
+        if not (api_key and len(api_key) > 10):
+            print("⚠️ AssemblyAI API key missing or invalid.")
+            return None
+        
+        try:
+            aai.settings.api_key = api_key
+            aai.settings.http_timeout = 300.0      # 5 minute timeout
+            aai.settings.polling_interval = 3.0    # Check every 3 seconds
+            client = aai.Transcriber()
+            print("✅ AssemblyAI initialized - Premium transcription ready!")
+            return client
+        except Exception as e:
+            print(f"⚠️ AssemblyAI initialization failed: {e}")
+            return None
+
+    def _build_aai_config(self):
+        """Transcription settings shared by every AssemblyAI request"""
+        # CRITICAL: Enable speaker_labels for conversation format
+        return aai.TranscriptionConfig(
+            speaker_labels=True,              # ENABLE for conversation format
+            speakers_expected=2,              # Expected number of speakers
+            punctuate=True,
+            format_text=True,
+            language_detection=True,
+            auto_chapters=False,              # Disable chapters for cleaner output
+            entity_detection=False            # Disable entities for cleaner output
+        )
+
+    def _init_whisper(self):
+        """Load Whisper as fallback; returns (model, backend) or (None, None)"""
+        # faster-whisper's int8 CTranslate2 build when installed
+        if FASTER_WHISPER_AVAILABLE:
+            try:
+                model = WhisperModel("base", device="auto", compute_type="int8",
+                                     num_workers=WHISPER_MAX_WORKERS)
+                print("✅ Whisper model loaded as fallback (faster-whisper int8)")
+                return model, "faster-whisper"
+            except Exception as e:
+                print(f"❌ faster-whisper loading failed: {e}")
         
-        # Load Whisper as fallback
         if WHISPER_AVAILABLE:
             try:
-                self.whisper_model = whisper.load_model("base")
+                model = whisper.load_model("base")
                 print("✅ Whisper model loaded as fallback")
+                return model, "whisper"
             except Exception as e:
                 print(f"❌ Whisper loading failed: {e}")
+        
+        return None, None
 
-        # Optional: Load pyannote for better speaker diarization
+    def _init_pyannote(self):
+        """Optional: Load pyannote for better speaker diarization; returns the pipeline or None"""
         try:
             from pyannote.audio import Pipeline
-            self.diarization_pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization-3.1")
+            pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization-3.1")
             print("✅ Pyannote diarization loaded")
+            return pipeline
         except Exception as e:
             print(f"⚠️ Pyannote diarization not available: {e}")
+            return None
 
-    def transcribe_audio(self, audio_file_path, participant_names=None):
-        """Main transcription method with conversation format"""
-        if not os.path.exists(audio_file_path):
-            return "❌ Error: Audio file not found"
+    def transcribe_audio(self, audio_file_path, out=None):
+        """Main transcription method with conversation format; writes to out if given, else returns the text"""
+        if out is None:
+            buf = io.StringIO()
+            self.transcribe_audio(audio_file_path, buf)
+            return buf.getvalue()
         
-        if not participant_names:
-            participant_names = [f"Person {i+1}" for i in range(5)]
+        if not os.path.exists(audio_file_path):
+            out.write("❌ Error: Audio file not found")
+            return
         
         print(f"🤖 Starting transcription: {os.path.basename(audio_file_path)}")
         
@@ -79,16 +305,28 @@ class TranscriptionService:
         
         # Check if audio has meaningful content
         if audio_info['max_volume'] < 0.01:
-            return self.create_error_message(audio_file_path, audio_info)
+            self._write_error(out, audio_file_path, audio_info)
+            return
+        
+        # Reuse an earlier AssemblyAI result for the same audio instead of uploading again
+        cache_path = self._cache_path(audio_file_path)
+        transcript_text = self._load_cached_transcript(cache_path)
+        if transcript_text:
+            print("   ♻️ Using cached AssemblyAI transcript")
+            self._write_professional(out, transcript_text, audio_file_path, audio_info, "AssemblyAI Premium")
+            return
         
         # Try AssemblyAI with speaker diarization enabled
         if self.assemblyai_client:
             print("   🚀 Trying AssemblyAI Premium...")
             try:
-                transcript_text = self._transcribe_with_assemblyai(audio_file_path)
+                with self._aai_sem:
+                    transcript_text = self._transcribe_with_assemblyai(audio_file_path)
                 if transcript_text:
                     print("   ✅ AssemblyAI completed successfully")
-                    return self.create_professional_transcript(transcript_text, audio_file_path, audio_info, "AssemblyAI Premium")
+                    self._save_cached_transcript(cache_path, transcript_text)
+                    self._write_professional(out, transcript_text, audio_file_path, audio_info, "AssemblyAI Premium")
+                    return
                 else:
                     print(f"   ❌ AssemblyAI failed to produce transcript")
             except Exception as e:
@@ -98,16 +336,48 @@ class TranscriptionService:
         if self.whisper_model:
             print("   🔄 Using Whisper fallback...")
             try:
-                transcript_text = self._transcribe_with_whisper(audio_file_path)
+                with self._whisper_sem:
+                    transcript_text = self._transcribe_with_whisper(audio_file_path)
                 if transcript_text:
                     print("   ✅ Whisper completed successfully")
                     # Format Whisper output as conversation with simple speaker detection
                     formatted_text = self._format_whisper_as_conversation(transcript_text)
-                    return self.create_professional_transcript(formatted_text, audio_file_path, audio_info, "Whisper Local")
+                    self._write_professional(out, formatted_text, audio_file_path, audio_info, "Whisper Local")
+                    return
             except Exception as e:
                 print(f"   ❌ Whisper failed: {e}")
         
-        return self.create_failure_message(audio_file_path, audio_info)
+        self._write_failure(out, audio_file_path, audio_info)
+
+    def _cache_path(self, audio_file_path):
+        """Cache file for this audio's content, or None if the file can't be hashed"""
+        try:
+            st = os.stat(audio_file_path)
+            key = _audio_digest(os.path.abspath(audio_file_path), st.st_size, st.st_mtime_ns)
+        except OSError:
+            return None
+        return os.path.join(Config.CACHE_OUTPUT_DIR, f"{key}.json")
+
+    def _load_cached_transcript(self, cache_path):
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('conversation')
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_transcript(self, cache_path, conversation_text):
+        if not cache_path:
+            return
+        try:
+            os.makedirs(Config.CACHE_OUTPUT_DIR, exist_ok=True)
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'conversation': conversation_text}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"   ⚠️ Could not cache transcript: {e}")
 
     def _format_whisper_as_conversation(self, transcript_text):
         """Format Whisper transcript as conversation by detecting natural breaks"""
@@ -115,7 +385,7 @@ class TranscriptionService:
             return f"Person 1: {transcript_text}"
         
         # Split by sentences and natural conversation breaks
-        sentences = re.split(r'[.!?]+\s*', transcript_text.strip())
+        sentences = _SENT_SPLIT.split(transcript_text.strip())
         sentences = [s.strip() for s in sentences if s.strip()]
         
         if len(sentences) <= 1:
@@ -127,57 +397,56 @@ class TranscriptionService:
         for i, sentence in enumerate(sentences):
             if sentence:
                 # Simple heuristic: alternate speakers every 2-3 sentences or on certain phrases
-                if i > 0 and (
-                    i % 3 == 0 or  # Every 3 sentences
-                    any(phrase in sentence.lower() for phrase in [
-                        'yes', 'no', 'okay', 'right', 'sure', 'well', 'so', 'but', 'however',
-                        'i think', 'i believe', 'actually', 'basically', 'definitely'
-                    ])
-                ):
+                if i > 0 and (i % 3 == 0 or self._has_speaker_cue(sentence)):
                     current_speaker = 2 if current_speaker == 1 else 1
                 
                 conversation_parts.append(f"Person {current_speaker}: {sentence.strip()}.")
         
         return "\n\n".join(conversation_parts)
 
-    def _transcribe_with_assemblyai(self, audio_file_path):
+    def _has_speaker_cue(self, sentence):
+        """True if the sentence contains a cue word or phrase that suggests a new speaker"""
+        s_lower = sentence.lower()
+        return (not _CUES.isdisjoint(_WORD_RE.findall(s_lower))
+                or any(phrase in s_lower for phrase in _MULTI_CUES))
+
+    def _transcribe_with_assemblyai(self, audio_file_path, webhook_url=None):
         """Transcribe using AssemblyAI WITH speaker diarization for conversation format"""
+        webhook_url = webhook_url or self.webhook_url
         try:
-            # CRITICAL: Enable speaker_labels for conversation format
-            config = aai.TranscriptionConfig(
-                speaker_labels=True,              # ENABLE for conversation format
-                speakers_expected=2,              # Expected number of speakers
-                punctuate=True,
-                format_text=True,
-                language_detection=True,
-                auto_chapters=False,              # Disable chapters for cleaner output
-                entity_detection=False            # Disable entities for cleaner output
-            )
-            
-            print("      📡 Uploading to AssemblyAI with speaker diarization...")
-            transcript = self.assemblyai_client.transcribe(audio_file_path, config)
+            config = self._aai_config
             
-            # Wait for completion with extended timeout
             start_time = time.time()
-            max_wait_time = 900  # 15 minutes max
+            max_wait_time = 900  # 15 minutes max for the webhook to arrive
+            
+            print("      📡 Uploading to AssemblyAI with speaker diarization...")
+            listener = None
+            if webhook_url:
+                try:
+                    listener = _get_webhook_listener(self.webhook_port)
+                except OSError as e:
+                    print(f"      ⚠️ Webhook port {self.webhook_port} unavailable ({e}), polling instead")
             
-            while transcript.status not in ["completed", "error"]:
-                elapsed = time.time() - start_time
-                if elapsed > max_wait_time:
-                    print("      ❌ AssemblyAI timeout after 15 minutes")
+            if listener:
+                # Let AssemblyAI notify us instead of polling (on a copy; the shared config stays webhook-free)
+                config = copy.deepcopy(config)
+                config.set_webhook(webhook_url)
+                transcript = self.assemblyai_client.submit(audio_file_path, config)
+                if transcript.status == "error" or not transcript.id:
+                    # Upload or job creation failed; no webhook will ever arrive
+                    print(f"      ❌ AssemblyAI error: {getattr(transcript, 'error', 'Submit failed')}")
                     return None
                 
-                mins, secs = divmod(int(elapsed), 60)
-                print(f"      🔄 Processing... {mins:02d}:{secs:02d}", end='\r')
-                
-                time.sleep(10)  # Check every 10 seconds
-                
-                try:
-                    transcript = self.assemblyai_client.get_transcript(transcript.id)
-                except Exception as e:
-                    print(f"      ⚠️ Polling error: {e}")
-                    time.sleep(5)
-                    continue
+                print("      📬 Waiting for AssemblyAI webhook...")
+                webhook_arrived = listener.wait(transcript.id, max_wait_time)
+                transcript = aai.Transcript.get_by_id(transcript.id)
+                if not webhook_arrived and transcript.status not in ("completed", "error"):
+                    # The callback may not be reaching us; poll until the job settles instead of dropping it
+                    print("      ⚠️ No webhook after 15 minutes, polling AssemblyAI instead")
+                    transcript = transcript.wait_for_completion()
+            else:
+                # Blocks until done, polling every aai.settings.polling_interval seconds
+                transcript = self.assemblyai_client.transcribe(audio_file_path, config)
             
             if transcript.status == "completed":
                 elapsed = int(time.time() - start_time)
@@ -227,50 +496,28 @@ class TranscriptionService:
         try:
             print("      🎯 Processing with Whisper...")
             
-            result = self.whisper_model.transcribe(
-                audio_file_path,
-                fp16=False,
-                language="en",
-                verbose=False,
-                temperature=0.0,
-                condition_on_previous_text=False,  # Prevents repetition
-                no_speech_threshold=0.6,          # Better silence detection
-                logprob_threshold=-1.0            # Filter low-confidence words
-            )
-            
-            text = result["text"].strip()
+            # 16 kHz mono float32, the format Whisper works in. Only faster-whisper can serve parallel
+            # chunks from one model (num_workers); upstream Whisper keeps decoding hooks on the model,
+            # so it would need a full copy per worker and transcribes the whole file instead
+            if self.whisper_backend == "faster-whisper":
+                audio = decode_audio(audio_file_path, sampling_rate=WHISPER_SAMPLE_RATE)
+                chunks = _split_at_silences(audio)
+            else:
+                audio = whisper.load_audio(audio_file_path)
+                chunks = [audio]
+            workers = min(WHISPER_MAX_WORKERS, len(chunks))
             
-            # DETECT AND FILTER HALLUCINATIONS
-            words = text.split()
-            if len(words) > 3:
-                # Check for repeated words (hallucination detection)
-                word_counts = {}
-                for word in words:
-                    word_counts[word] = word_counts.get(word, 0) + 1
+            if workers <= 1:
+                texts = [self._whisper_chunk_text(self.whisper_model, audio)]
+            else:
+                print(f"      ⚡ {len(chunks)} chunks across {workers} workers")
+                model = self.whisper_model
                 
-                # If any word appears more than 30% of the time, it's likely hallucination
-                max_word_count = max(word_counts.values())
-                if max_word_count > len(words) * 0.3:
-                    most_repeated = max(word_counts, key=word_counts.get)
-                    print(f"      ⚠️ Hallucination detected: '{most_repeated}' repeated {max_word_count} times")
-                    
-                    # Clean the text by removing excessive repetitions
-                    cleaned_words = []
-                    prev_word = ""
-                    repeat_count = 0
-                    
-                    for word in words:
-                        if word == prev_word:
-                            repeat_count += 1
-                            if repeat_count < 2:  # Allow max 1 consecutive repeat
-                                cleaned_words.append(word)
-                        else:
-                            cleaned_words.append(word)
-                            repeat_count = 0
-                        prev_word = word
-                    
-                    text = " ".join(cleaned_words)
-                    print(f"      🔧 Cleaned text: {len(cleaned_words)} words (was {len(words)})")
+                # map() yields results in chunk order
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    texts = list(pool.map(lambda piece: self._whisper_chunk_text(model, piece), chunks))
+            
+            text = " ".join(t for t in texts if t)
             
             if len(text) > 5:
                 print(f"      ✅ Whisper completed ({len(text)} characters)")
@@ -283,21 +530,83 @@ class TranscriptionService:
             print(f"      ❌ Whisper error: {e}")
             return None
 
+    def _whisper_chunk_text(self, model, audio):
+        """Run Whisper on one audio array and filter repetition hallucinations"""
+        if self.whisper_backend == "faster-whisper":
+            segments, _ = model.transcribe(
+                audio,
+                language="en",
+                temperature=0.0,
+                condition_on_previous_text=False,  # Prevents repetition
+                no_speech_threshold=0.6,          # Better silence detection
+                log_prob_threshold=-1.0,          # Filter low-confidence words
+                vad_filter=True,                  # Skip silent stretches before decoding
+                vad_parameters={"min_silence_duration_ms": WHISPER_VAD_MIN_SILENCE_MS}
+            )
+            # Segments are generated lazily; decoding happens while joining
+            text = " ".join(segment.text.strip() for segment in segments)
+        else:
+            result = model.transcribe(
+                audio,
+                fp16=False,
+                language="en",
+                verbose=False,
+                temperature=0.0,
+                condition_on_previous_text=False,  # Prevents repetition
+                no_speech_threshold=0.6,          # Better silence detection
+                logprob_threshold=-1.0            # Filter low-confidence words
+            )
+            text = result["text"].strip()
+        
+        # DETECT AND FILTER HALLUCINATIONS
+        words = text.split()
+        if len(words) > 3:
+            # Check for repeated words (hallucination detection)
+            most_repeated, max_word_count = Counter(words).most_common(1)[0]
+            
+            # If any word appears more than 30% of the time, it's likely hallucination
+            if max_word_count > len(words) * 0.3:
+                print(f"      ⚠️ Hallucination detected: '{most_repeated}' repeated {max_word_count} times")
+                
+                # Clean the text by removing excessive repetitions (allow max 1 consecutive repeat)
+                cleaned_words = [w for _, run in groupby(words) for w in islice(run, 2)]
+                
+                text = " ".join(cleaned_words)
+                print(f"      🔧 Cleaned text: {len(cleaned_words)} words (was {len(words)})")
+        
+        return text
+
     def get_audio_info(self, audio_file_path):
         """Analyze audio file for quality and content"""
         try:
             filesize = os.path.getsize(audio_file_path)
             
-            with wave.open(audio_file_path, 'rb') as wf:
-                frames = wf.getnframes()
-                rate = wf.getframerate()
+            layout = _wav_layout(audio_file_path)
+            if layout:
+                # Map the first second straight from the page cache instead of reading a copy
+                data_offset, channels, rate, frames = layout
                 duration = frames / rate
-                
-                # Read sample to check volume
-                sample_frames = min(frames, rate)  # First second
-                audio_data = wf.readframes(sample_frames)
-                audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-                max_volume = np.max(np.abs(audio_array)) if len(audio_array) > 0 else 0.0
+                sample_frames = min(frames, rate, (filesize - data_offset) // (channels * 2))
+                if sample_frames > 0:
+                    audio_array = np.memmap(audio_file_path, dtype='<i2', mode='r',
+                                            offset=data_offset, shape=(sample_frames * channels,))
+                else:
+                    audio_array = np.empty(0, dtype=np.int16)
+            else:
+                # Non-PCM16 or unusual header: let wave parse it
+                with wave.open(audio_file_path, 'rb') as wf:
+                    frames = wf.getnframes()
+                    rate = wf.getframerate()
+                    duration = frames / rate
+                    
+                    # Read sample to check volume
+                    sample_frames = min(frames, rate)  # First second
+                    audio_array = np.frombuffer(wf.readframes(sample_frames), dtype=np.int16)
+            
+            # Peak on the raw int16 samples; scale once instead of converting the whole buffer
+            peak = max(int(audio_array.max(initial=0)), -int(audio_array.min(initial=0)))
+            max_volume = peak / 32768.0
+            del audio_array  # Release the mapping so the file isn't held open
             
             return {
                 "duration": duration,
@@ -316,10 +625,16 @@ class TranscriptionService:
 
     def create_professional_transcript(self, conversation_text, audio_file_path, audio_info, service_name):
         """Create formatted professional transcript"""
+        buf = io.StringIO()
+        self._write_professional(buf, conversation_text, audio_file_path, audio_info, service_name)
+        return buf.getvalue()
+
+    def _write_professional(self, fh, conversation_text, audio_file_path, audio_info, service_name):
+        """Write the professional transcript section by section to an open text file"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         filename = os.path.basename(audio_file_path)
         
-        return f"""GOOGLE MEET PROFESSIONAL TRANSCRIPT
+        fh.write(f"""GOOGLE MEET PROFESSIONAL TRANSCRIPT
 {'=' * 70}
 📅 Generated: {timestamp}
 🔧 Transcription Service: {service_name}
@@ -332,7 +647,10 @@ class TranscriptionService:
 
 MEETING CONVERSATION:
 {'─' * 70}
-{conversation_text}
+""")
+        # The conversation is the bulk of the output; write it as-is rather than copying it into a larger string
+        fh.write(conversation_text)
+        fh.write(f"""
 {'─' * 70}
 
 
@@ -346,14 +664,20 @@ MEETING SUMMARY:
 {'=' * 70}
 Meeting transcript generated by Google Meet Recording Bot.
 Bot operated invisibly with visible microphone indicator.
-{'=' * 70}"""
+{'=' * 70}""")
 
     def create_error_message(self, audio_file_path, audio_info):
         """Create error message for silent audio"""
+        buf = io.StringIO()
+        self._write_error(buf, audio_file_path, audio_info)
+        return buf.getvalue()
+
+    def _write_error(self, fh, audio_file_path, audio_info):
+        """Write the no-speech message to an open text file"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         filename = os.path.basename(audio_file_path)
         
-        return f"""GOOGLE MEET TRANSCRIPT - NO SPEECH DETECTED
+        fh.write(f"""GOOGLE MEET TRANSCRIPT - NO SPEECH DETECTED
 {'=' * 70}
 📅 Generated: {timestamp}
 📁 Audio File: {filename}
@@ -374,14 +698,20 @@ TROUBLESHOOTING STEPS:
 
 {'=' * 70}
 Please fix audio setup and try recording again.
-{'=' * 70}"""
+{'=' * 70}""")
 
     def create_failure_message(self, audio_file_path, audio_info):
         """Create failure message when transcription services fail"""
+        buf = io.StringIO()
+        self._write_failure(buf, audio_file_path, audio_info)
+        return buf.getvalue()
+
+    def _write_failure(self, fh, audio_file_path, audio_info):
+        """Write the message for when every transcription service failed to an open text file"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         filename = os.path.basename(audio_file_path)
         
-        return f"""GOOGLE MEET TRANSCRIPT - TRANSCRIPTION SERVICES ISSUE
+        fh.write(f"""GOOGLE MEET TRANSCRIPT - TRANSCRIPTION SERVICES ISSUE
 {'=' * 70}
 📅 Generated: {timestamp}
 📁 Audio File: {filename}
@@ -414,4 +744,4 @@ TECHNICAL DETAILS:
 
 {'=' * 70}
 Audio was captured successfully - transcription service issue only.
-{'=' * 70}"""
+{'=' * 70}""")
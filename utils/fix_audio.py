@@ -18,19 +18,17 @@ def find_latest_audio_file():
     if not os.path.exists(audio_dir):
         return None
     
-    audio_files = [f for f in os.listdir(audio_dir) 
-                   if f.endswith(('.wav', '.mp3', '.m4a'))]
+    # scandir entries cache their stat, so each file is only stat'd once
+    with os.scandir(audio_dir) as it:
+        audio_files = [e for e in it if e.name.endswith(('.wav', '.mp3', '.m4a'))]
     
     if not audio_files:
         return None
     
-    # Sort by modification time
-    audio_files.sort(
-        key=lambda x: os.path.getmtime(os.path.join(audio_dir, x)), 
-        reverse=True
-    )
+    # Newest by modification time
+    latest = max(audio_files, key=lambda e: e.stat().st_mtime)
     
-    return os.path.join(audio_dir, audio_files[0])
+    return latest.path
 
 def process_audio_file(audio_file_path):
     """Process existing audio file"""
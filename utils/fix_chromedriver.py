@@ -4,131 +4,197 @@ Downloads and configures ChromeDriver automatically
 """
 import os
 import sys
+import json
+import shutil
 import subprocess
 import platform
 import requests
+import re
 import zipfile
+from functools import lru_cache
 
-def get_chrome_version():
-    """Detect installed Chrome version"""
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from config import Config
+
+# One keep-alive session so repeat requests to the same host reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Meet-Record-Bot ChromeDriver setup"})
+
+_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+
+# Chrome-for-Testing replaces the chromedriver.storage.googleapis.com endpoints for Chrome 115+
+CFT_VERSIONS_URL = "https://googlechromelabs.github.io/chrome-for-testing/known-good-versions-with-downloads.json"
+CFT_CACHE_FILE = os.path.join(Config.CACHE_OUTPUT_DIR, "chrome_for_testing_versions.json")
+CFT_FIRST_MAJOR = 115
+LEGACY_DRIVER_URL = "https://chromedriver.storage.googleapis.com"
+
+def _version_from_binary(path):
+    """Run a Chrome binary with --version and parse the version number"""
+    try:
+        result = subprocess.run([path, "--version"],
+                              capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            match = _VERSION_RE.search(result.stdout)
+            if match:
+                return match.group(1)
+    except:
+        pass
+    return None
+
+def _windows_chrome_version():
+    # Try registry method first (no process spawn)
+    import winreg
     try:
-        if platform.system() == "Windows":
-            # Try registry method first
-            import winreg
-            try:
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                   r"Software\Google\Chrome\BLBeacon")
-                version, _ = winreg.QueryValueEx(key, "version")
-                winreg.CloseKey(key)
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
+                           r"Software\Google\Chrome\BLBeacon")
+        version, _ = winreg.QueryValueEx(key, "version")
+        winreg.CloseKey(key)
+        return version
+    except:
+        pass
+    
+    # Try command line
+    chrome_paths = [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
+    ]
+    
+    for path in chrome_paths:
+        if os.path.exists(path):
+            version = _version_from_binary(path)
+            if version:
                 return version
-            except:
-                pass
-            
-            # Try command line
-            chrome_paths = [
-                r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
-            ]
-            
-            for path in chrome_paths:
-                if os.path.exists(path):
-                    try:
-                        result = subprocess.run([path, "--version"], 
-                                              capture_output=True, text=True, timeout=5)
-                        if result.returncode == 0:
-                            import re
-                            match = re.search(r'(\d+\.\d+\.\d+\.\d+)', result.stdout)
-                            if match:
-                                return match.group(1)
-                    except:
-                        continue
-        
-        elif platform.system() == "Darwin":  # macOS
-            try:
-                result = subprocess.run(["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    import re
-                    match = re.search(r'(\d+\.\d+\.\d+\.\d+)', result.stdout)
-                    if match:
-                        return match.group(1)
-            except:
-                pass
-        
-        else:  # Linux
-            try:
-                result = subprocess.run(["google-chrome", "--version"],
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    import re
-                    match = re.search(r'(\d+\.\d+\.\d+\.\d+)', result.stdout)
-                    if match:
-                        return match.group(1)
-            except:
-                pass
-        
-        return None
+    return None
+
+def _mac_chrome_version():
+    return _version_from_binary("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
+
+def _linux_chrome_version():
+    return _version_from_binary("google-chrome")
+
+_CHROME_VERSION_PROBES = {
+    "Windows": _windows_chrome_version,
+    "Darwin": _mac_chrome_version,  # macOS
+}
+
+@lru_cache(maxsize=1)
+def get_chrome_version():
+    """Detect installed Chrome version (cached; probing may spawn Chrome)"""
+    try:
+        probe = _CHROME_VERSION_PROBES.get(platform.system(), _linux_chrome_version)
+        return probe()
         
     except Exception as e:
         print(f"Error detecting Chrome version: {e}")
         return None
 
+def _known_good_versions():
+    """Chrome-for-Testing version list, revalidated against a local copy with If-Modified-Since"""
+    cached = None
+    try:
+        with open(CFT_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    headers = {}
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    
+    try:
+        response = _SESSION.get(CFT_VERSIONS_URL, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            return cached["data"]
+        response.raise_for_status()
+        data = response.json()
+    except Exception:
+        if cached:
+            print("   ⚠️ Could not refresh ChromeDriver version list, using cached copy")
+            return cached["data"]
+        raise
+    
+    try:
+        os.makedirs(Config.CACHE_OUTPUT_DIR, exist_ok=True)
+        with open(CFT_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"last_modified": response.headers.get("Last-Modified"), "data": data}, f)
+    except OSError:
+        pass
+    return data
+
+def _cft_platform():
+    """Chrome-for-Testing platform name for this machine"""
+    system = platform.system()
+    machine = platform.machine().lower()
+    if system == "Windows":
+        return "win64" if machine.endswith("64") else "win32"
+    if system == "Darwin":
+        return "mac-arm64" if machine in ("arm64", "aarch64") else "mac-x64"
+    return "linux64"
+
+def _legacy_chromedriver(major_version):
+    """(version, url) from the old storage endpoints, which only serve Chrome 114 and earlier"""
+    response = _SESSION.get(f"{LEGACY_DRIVER_URL}/LATEST_RELEASE_{major_version}", timeout=10)
+    if response.status_code != 200:
+        raise Exception(f"No ChromeDriver found for Chrome {major_version}")
+    
+    chromedriver_version = response.text.strip()
+    suffix = {"Windows": "win32", "Darwin": "mac64"}.get(platform.system(), "linux64")
+    return chromedriver_version, f"{LEGACY_DRIVER_URL}/{chromedriver_version}/chromedriver_{suffix}.zip"
+
+def _cft_chromedriver(major_version):
+    """(version, url) of the newest Chrome-for-Testing driver, for the given major or overall"""
+    platform_suffix = _cft_platform()
+    
+    # One request lists every version and its per-platform downloads (oldest first)
+    available = []
+    for entry in _known_good_versions()["versions"]:
+        if major_version and entry["version"].split('.')[0] != major_version:
+            continue
+        for download in entry.get("downloads", {}).get("chromedriver", []):
+            if download["platform"] == platform_suffix:
+                available.append((entry["version"], download["url"]))
+    
+    if not available:
+        target = f"Chrome {major_version}" if major_version else "any Chrome version"
+        raise Exception(f"No ChromeDriver listed for {target} on {platform_suffix}")
+    return available[-1]
+
 def download_chromedriver(version=None):
     """Download compatible ChromeDriver"""
     try:
         print("🔄 Downloading ChromeDriver...")
         
-        # Determine platform
-        system = platform.system().lower()
-        if system == "windows":
-            platform_suffix = "win32"
-            driver_name = "chromedriver.exe"
-        elif system == "darwin":
-            platform_suffix = "mac64"
-            driver_name = "chromedriver"
-        else:
-            platform_suffix = "linux64"
-            driver_name = "chromedriver"
+        driver_name = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
         
-        # Get ChromeDriver version
-        if version:
-            major_version = version.split('.')[0]
-            try:
-                response = requests.get(
-                    f"https://chromedriver.storage.googleapis.com/LATEST_RELEASE_{major_version}",
-                    timeout=10
-                )
-                if response.status_code == 200:
-                    chromedriver_version = response.text.strip()
-                else:
-                    raise Exception("Version not found")
-            except:
-                print(f"Could not find ChromeDriver for Chrome {major_version}, using latest")
-                response = requests.get("https://chromedriver.storage.googleapis.com/LATEST_RELEASE")
-                chromedriver_version = response.text.strip()
+        # Get ChromeDriver version (a mismatched driver can't start Chrome, so never guess)
+        major_version = version.split('.')[0] if version else None
+        if major_version and int(major_version) < CFT_FIRST_MAJOR:
+            chromedriver_version, download_url = _legacy_chromedriver(major_version)
         else:
-            response = requests.get("https://chromedriver.storage.googleapis.com/LATEST_RELEASE")
-            chromedriver_version = response.text.strip()
-        
-        # Download URL
-        download_url = (f"https://chromedriver.storage.googleapis.com/"
-                       f"{chromedriver_version}/chromedriver_{platform_suffix}.zip")
+            chromedriver_version, download_url = _cft_chromedriver(major_version)
         
         print(f"   📦 Version: {chromedriver_version}")
         print(f"   🌐 Downloading from: {download_url}")
         
-        # Download
-        response = requests.get(download_url, timeout=30)
-        if response.status_code != 200:
-            raise Exception(f"Download failed: HTTP {response.status_code}")
-        
-        # Save and extract
+        # Download straight to disk in 1 MB chunks rather than holding the whole zip in memory
         zip_path = "chromedriver.zip"
-        with open(zip_path, "wb") as f:
-            f.write(response.content)
+        with _SESSION.get(download_url, stream=True, timeout=30) as response:
+            if response.status_code != 200:
+                raise Exception(f"Download failed: HTTP {response.status_code}")
+            with open(zip_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
         
+        # Extract just the driver (Chrome-for-Testing zips nest it in chromedriver-<platform>/, old ones don't)
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(".")
+            member = next((name for name in zip_ref.namelist()
+                           if os.path.basename(name) == driver_name), None)
+            if member is None:
+                raise Exception(f"{driver_name} not found in archive")
+            with zip_ref.open(member) as src, open(driver_name, "wb") as dst:
+                shutil.copyfileobj(src, dst)
         
         os.remove(zip_path)
         